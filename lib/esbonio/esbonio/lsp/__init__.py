@@ -131,9 +131,6 @@ def _configure_lsp_methods(server: RstLanguageServer) -> RstLanguageServer:
     def on_save(ls: RstLanguageServer, params: DidSaveTextDocumentParams):
         ls.save(params)
 
-        for feature in ls._features.values():
-            feature.save(params)
-
     @server.feature(
         WORKSPACE_DID_DELETE_FILES,
         FileOperationRegistrationOptions(
@@ -248,7 +248,7 @@ class Directives(LanguageFeature):
             doc["description"] = "\n".join(description)
             self._documentation[key] = doc
 
-    completion_triggers = [DIRECTIVE, DIRECTIVE_OPTION]
+    completion_triggers = (DIRECTIVE, DIRECTIVE_OPTION)
 
     def completion_resolve(self, item: CompletionItem) -> CompletionItem:
 
@@ -452,7 +452,7 @@ class Directives(LanguageFeature):
         item.documentation = MarkupContent(kind=kind, value=description)
         return item
 
-    definition_triggers = [DIRECTIVE]
+    definition_triggers = (DIRECTIVE,)
 
     def definition(self, context: DefinitionContext) -> List[Location]:
         self.rst.logger.debug("%s", context)
@@ -237,8 +237,8 @@ class Roles(LanguageFeature):
             doc["description"] = "\n".join(description)
             self._documentation[key] = doc
 
-    completion_triggers = [ROLE, DEFAULT_ROLE]
-    definition_triggers = [ROLE]
+    completion_triggers = (ROLE, DEFAULT_ROLE)
+    definition_triggers = (ROLE,)
 
     def definition(self, context: DefinitionContext) -> List[Location]:
 
@@ -8,6 +8,7 @@ from typing import Any
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Set
 from typing import Tuple
 from typing import Union
 
@@ -42,6 +43,10 @@ from esbonio.cli import setup_cli
 TRIPLE_QUOTE = re.compile("(\"\"\"|''')")
 """A regular expression matching the triple quotes used to delimit python docstrings."""
 
+# ``re.Pattern`` is not available in Python 3.6
+PATTERN_TYPE = type(TRIPLE_QUOTE)
+"""The type of a compiled regular expression."""
+
 DEFAULT_MODULES = [
     "esbonio.lsp.directives",
     "esbonio.lsp.roles",
@@ -108,6 +113,23 @@ class DefinitionContext:
 class LanguageFeature:
     """Base class for language features."""
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # Triggers are matched against the current line on every request, so insist
+        # that they are compiled up front.
+        for attr in ["completion_triggers", "definition_triggers"]:
+            triggers = tuple(getattr(cls, attr))
+
+            for pattern in triggers:
+                if not isinstance(pattern, PATTERN_TYPE):
+                    raise TypeError(
+                        f"{cls.__name__}.{attr} must only contain compiled regular "
+                        f"expressions, got: {pattern!r}"
+                    )
+
+            setattr(cls, attr, triggers)
+
     def __init__(self, rst: "RstLanguageServer"):
         self.rst = rst
         self.logger = rst.logger.getChild(self.__class__.__name__)
@@ -128,8 +150,8 @@ class LanguageFeature:
         """Called when code actions should be computed."""
         return []
 
-    completion_triggers: List["re.Pattern"] = []
-    """A list of regular expressions used to determine if the
+    completion_triggers: Tuple["re.Pattern", ...] = ()
+    """A tuple of compiled regular expressions used to determine if the
     :meth`~esbonio.lsp.rst.LanguageFeature.complete` method should be called on the
     current line."""
 
@@ -156,8 +178,8 @@ class LanguageFeature:
         """
         return item
 
-    definition_triggers: List["re.Pattern"] = []
-    """A list of regular expressions used to determine if the
+    definition_triggers: Tuple["re.Pattern", ...] = ()
+    """A tuple of compiled regular expressions used to determine if the
     :meth:`~esbonio.lsp.rst.LanguageFeature.definition` method should be called."""
 
     def definition(self, context: DefinitionContext) -> List[Location]:
@@ -233,6 +255,9 @@ class RstLanguageServer(LanguageServer):
         self._diagnostics: Dict[Tuple[str, str], List[Diagnostic]] = {}
         """Where we store and manage diagnostics."""
 
+        self._dirty_uris: Set[str] = set()
+        """The uris whose diagnostics have changed since they were last published."""
+
         self._features: Dict[str, LanguageFeature] = {}
         """The list of language features registered with the server."""
 
@@ -260,7 +285,8 @@ class RstLanguageServer(LanguageServer):
         pass
 
     def save(self, params: DidSaveTextDocumentParams):
-        pass
+        for feature in self._features.values():
+            feature.save(params)
 
     def delete_files(self, params: DeleteFilesParams):
         pass
@@ -342,8 +368,9 @@ class RstLanguageServer(LanguageServer):
             clear_source = source == key[0]
             clear_uri = uri == key[1] or uri is None
 
-            if clear_source and clear_uri:
+            if clear_source and clear_uri and len(self._diagnostics[key]) > 0:
                 self._diagnostics[key] = []
+                self._dirty_uris.add(key[1])
 
     def set_diagnostics(
         self, source: str, uri: str, diagnostics: List[Diagnostic]
@@ -360,17 +387,34 @@ class RstLanguageServer(LanguageServer):
            The diagnostics themselves
         """
         uri = normalise_uri(uri)
-        self._diagnostics[(source, uri)] = diagnostics
+        key = (source, uri)
+
+        for diag in diagnostics:
+            diag.source = source
+
+        if self._diagnostics.get(key, []) != diagnostics:
+            self._dirty_uris.add(uri)
+
+        self._diagnostics[key] = diagnostics
 
     def sync_diagnostics(self) -> None:
-        """Update the client with the currently stored diagnostics."""
+        """Update the client with the currently stored diagnostics.
+
+        Only uris whose diagnostics have changed since they were last published are
+        sent to the client.
+        """
+
+        if len(self._dirty_uris) == 0:
+            return
+
+        diagnostics = {uri: DiagnosticList() for uri in self._dirty_uris}
+        self._dirty_uris = set()
 
-        uris = {uri for _, uri in self._diagnostics.keys()}
-        diagnostics = {uri: DiagnosticList() for uri in uris}
+        for (_, uri), diags in self._diagnostics.items():
+            if uri not in diagnostics:
+                continue
 
-        for (source, uri), diags in self._diagnostics.items():
             for diag in diags:
-                diag.source = source
                 diagnostics[uri].append(diag)
 
         for uri, diag_list in diagnostics.items():
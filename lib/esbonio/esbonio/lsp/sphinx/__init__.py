@@ -1,22 +1,28 @@
+import asyncio
+import functools
 import hashlib
 import logging
+import os
 import pathlib
 import re
+import sys
 import traceback
 import typing
+from collections import defaultdict
 from typing import Any
+from typing import DefaultDict
 from typing import Dict
-from typing import Iterator
+from typing import FrozenSet
 from typing import List
 from typing import Optional
 from typing import Tuple
+from typing import Union
 
 import appdirs
 import pygls.uris as Uri
 from docutils.parsers.rst import Directive
 from pydantic import BaseModel
 from pydantic import Field
-from pygls import IS_WIN
 from pygls.lsp.types import DeleteFilesParams
 from pygls.lsp.types import Diagnostic
 from pygls.lsp.types import DiagnosticSeverity
@@ -60,11 +66,24 @@ DEFAULT_MODULES = [
 """The modules to load in the default configuration of the server."""
 
 
+BUILD_DELAY = 0.3
+"""The time (in seconds) to wait after a file is saved before triggering a build.
+
+Any further saves within this window restart the timer, so a burst of saves results in a
+single build."""
+
 DIAGNOSTIC_SEVERITY = {
     logging.ERROR: DiagnosticSeverity.Error,
-    logging.INFO: DiagnosticSeverity.Information,
     logging.WARNING: DiagnosticSeverity.Warning,
 }
+"""Maps the level of a Sphinx log record to the severity of the diagnostic it
+should be reported as."""
+
+DIAGNOSTIC_LEVELS = frozenset(DIAGNOSTIC_SEVERITY)
+"""The log levels of Sphinx records that should be reported as diagnostics."""
+
+IGNORED_DIRS = frozenset({".tox", ".venv", "node_modules", "site-packages", "venv"})
+"""Directories that are skipped when searching for a project's ``conf.py``."""
 
 PATH_VAR_PATTERN = re.compile(r"^\${(\w+)}/?.*")
 
@@ -119,7 +138,7 @@ class SphinxLogHandler(LspHandler):
         self.app = app
         self.translator = WarningLogRecordTranslator(app)
         self.only_once = OnceFilter()
-        self.diagnostics: Dict[str, List[Diagnostic]] = {}
+        self.diagnostics: DefaultDict[str, List[Diagnostic]] = defaultdict(list)
 
     def get_location(self, location: str) -> Tuple[str, Optional[int]]:
 
@@ -127,42 +146,41 @@ class SphinxLogHandler(LspHandler):
             conf = pathlib.Path(self.app.confdir, "conf.py")
             return (str(conf), None)
 
-        path, *parts = location.split(":")
-        lineno = None
+        # Sphinx's i18n transform gives translated text a source of
+        # '{path}:{lineno}:<translated>', with the line number of the warning within
+        # the translated text sometimes appended. Only the original line is useful.
+        location = location.partition(":<translated>")[0]
 
-        # On windows the rest of the path will be the first element of parts
-        if IS_WIN:
-            path += f":{parts.pop(0)}"
+        # Only the last component can be a line number, splitting from the right also
+        # means we don't have to worry about the drive letter in Windows paths.
+        path, _, suffix = location.rpartition(":")
+        lineno = None
 
-        if len(parts) == 1:
-            try:
-                lineno = int(parts[0])
-            except ValueError:
-                pass
+        if not path or (suffix and not suffix.isdecimal()):
+            path = location
+        elif suffix:
+            lineno = int(suffix)
 
-        if len(parts) == 2:
+        if ":docstring of " in path:
             # TODO: There's a possibility that there is an error in a docstring in a
-            #       *.py file somewhere. In which case parts would look like
-            #       ['docstring of {dotted.name}', '{lineno}']
+            #       *.py file somewhere. In which case the location would look like
+            #       '{path}:docstring of {dotted.name}:{lineno}'
             #
-            #  e.g. ['docstring of esbonio.lsp.sphinx.SphinxLanguageServer.get_domains', '8']
+            #  e.g. '.../sphinx/__init__.py:docstring of esbonio.lsp.sphinx.SphinxLanguageServer.get_domains:8'
             #
             #       It would be good to handle this case and look up the correct line
             #       number to place a diagnostic.
-            pass
+            path = path.partition(":docstring of ")[0]
+            lineno = None
 
         return (Uri.from_fs_path(path), lineno)
 
     def emit(self, record: logging.LogRecord) -> None:
 
-        conditions = [
-            "sphinx" not in record.name,
-            record.levelno not in {logging.WARNING, logging.ERROR},
-            not self.translator,
-        ]
-
-        if any(conditions):
-            # Log the record as normal
+        # This handler is only ever attached to the 'sphinx' logger, so every record we
+        # see comes from Sphinx. Anything that's not a warning/error can be logged as
+        # normal.
+        if record.levelno not in DIAGNOSTIC_LEVELS:
             super().emit(record)
             return
 
@@ -192,16 +210,10 @@ class SphinxLogHandler(LspHandler):
                 end=Position(line=line, character=0),
             ),
             message=message,
-            severity=DIAGNOSTIC_SEVERITY.get(
-                record.levelno, DiagnosticSeverity.Warning
-            ),
+            severity=DIAGNOSTIC_SEVERITY[record.levelno],
         )
 
-        if doc not in self.diagnostics:
-            self.diagnostics[doc] = [diagnostic]
-        else:
-            self.diagnostics[doc].append(diagnostic)
-
+        self.diagnostics[doc].append(diagnostic)
         super().emit(record)
 
 
@@ -214,10 +226,23 @@ class SphinxLanguageServer(RstLanguageServer):
         self.app: Optional[Sphinx] = None
         """The Sphinx application instance."""
 
+        self._build_timer: Optional[asyncio.TimerHandle] = None
+        """Used to delay builds triggered by saves, see ``BUILD_DELAY``."""
+
+        self._conf_hash: Optional[bytes] = None
+        """A hash of the ``conf.py`` file used to create the current application."""
+
+        self._saved: Dict[str, DidSaveTextDocumentParams] = {}
+        """Documents saved since the last build, features are notified of these once
+        the build has completed."""
+
+        self._domains: Optional[List[Tuple[str, Domain]]] = None
+        """Cache for known domains."""
+
         self._role_target_types: Optional[Dict[str, List[str]]] = None
         """Cache for role target types."""
 
-        self._role_targets: Dict[str, List[tuple]] = {}
+        self._role_targets: Optional[Dict[str, List[tuple]]] = None
         """Cache for role target objects."""
 
     @property
@@ -250,6 +275,9 @@ class SphinxLanguageServer(RstLanguageServer):
 
     def _initialize_sphinx(self):
 
+        # Anything indexed from the previous application is now out of date.
+        self._clear_indexes()
+
         try:
             return self.create_sphinx_app(self.user_config)
         except MissingConfigError:
@@ -277,10 +305,12 @@ class SphinxLanguageServer(RstLanguageServer):
             )
 
     def save(self, params: DidSaveTextDocumentParams):
-        super().save(params)
+        # Features (e.g. spelling) work with the doctree of the saved document, so they
+        # are not told about the save until the build has brought it up to date.
+        self._saved[params.text_document.uri] = params
 
         filepath = Uri.to_fs_path(params.text_document.uri)
-        if filepath.endswith("conf.py"):
+        if os.path.basename(filepath) == "conf.py":
             if self.app:
                 conf_dir = pathlib.Path(self.app.confdir)
             else:
@@ -295,11 +325,28 @@ class SphinxLanguageServer(RstLanguageServer):
                 ) or pathlib.Path(".")
 
             if str(conf_dir / "conf.py") == filepath:
-                self.app = self._initialize_sphinx()
+                conf_hash = hash_file(filepath)
+
+                if self.app is None or conf_hash != self._conf_hash:
+                    self.app = self._initialize_sphinx()
+                else:
+                    self.logger.debug("No changes to '%s', skipping reload", filepath)
         else:
             self.clear_diagnostics("sphinx", params.text_document.uri)
 
-        self.build()
+        # Saves often arrive in bursts (e.g. "Save All"), so wait a moment to see if
+        # there are any more before kicking off a build.
+        if self._build_timer is not None:
+            self._build_timer.cancel()
+
+        self._build_timer = self.loop.call_later(BUILD_DELAY, self.build)
+
+    def _notify_saved(self):
+        """Pass any documents saved since the last build on to the features."""
+
+        saved, self._saved = self._saved, {}
+        for params in saved.values():
+            super().save(params)
 
     def delete_files(self, params: DeleteFilesParams):
         self.logger.debug("Deleted files: %s", params.files)
@@ -312,7 +359,13 @@ class SphinxLanguageServer(RstLanguageServer):
 
     def build(self):
 
+        # Any pending build would be redundant.
+        if self._build_timer is not None:
+            self._build_timer.cancel()
+            self._build_timer = None
+
         if not self.app:
+            self._notify_saved()
             return
 
         self.logger.debug("Building...")
@@ -320,8 +373,9 @@ class SphinxLanguageServer(RstLanguageServer):
 
         # Reset the warnings counter
         self.app._warncount = 0
+        self._clear_indexes()
         error = False
-        self.sphinx_log.diagnostics = {}
+        self.sphinx_log.diagnostics = defaultdict(list)
 
         try:
             self.app.build()
@@ -337,6 +391,7 @@ class SphinxLanguageServer(RstLanguageServer):
             self.set_diagnostics("sphinx", doc, diagnostics)
 
         self.sync_diagnostics()
+        self._notify_saved()
         self.send_notification(
             "esbonio/buildComplete",
             {
@@ -369,6 +424,8 @@ class SphinxLanguageServer(RstLanguageServer):
         self.logger.debug("Build dir %s", build_dir)
         self.logger.debug("Doctree dir %s", doctree_dir)
 
+        self._conf_hash = hash_file(conf_dir / "conf.py")
+
         # Disable color escape codes in Sphinx's log messages
         console.nocolor()
 
@@ -448,24 +505,29 @@ class SphinxLanguageServer(RstLanguageServer):
         domains = self.app.env.domains
         return domains.get(name, None)
 
-    def get_domains(self) -> Iterator[Tuple[str, Domain]]:
+    def get_domains(self) -> List[Tuple[str, Domain]]:
         """Get all the domains registered with an applications.
 
-        Returns a generator that iterates through all of an application's domains,
-        taking into account configuration variables such as ``primary_domain``.
-        Yielded values will be a tuple of the form ``(prefix, domain)`` where
+        Returns a list of all of an application's domains, taking into account
+        configuration variables such as ``primary_domain``. Items in the list will be
+        a tuple of the form ``(prefix, domain)`` where
 
         - ``prefix`` is the namespace that should be used when referencing items
           in the domain
         - ``domain`` is the domain object itself.
 
+        The result is cached until the next build.
         """
 
         if self.app is None or self.app.env is None:
             return []
 
+        if self._domains is not None:
+            return self._domains
+
         domains = self.app.env.domains
         primary_domain = self.app.config.primary_domain
+        self._domains = []
 
         for name, domain in domains.items():
             prefix = name
@@ -474,24 +536,17 @@ class SphinxLanguageServer(RstLanguageServer):
             if name == "std" or name == primary_domain:
                 prefix = ""
 
-            yield prefix, domain
+            self._domains.append((prefix, domain))
+
+        return self._domains
 
     def get_directives(self) -> Dict[str, Directive]:
         """Return a dictionary of the known directives"""
 
-        if self._directives is not None:
-            return self._directives
+        if self._directives is None:
+            self._build_indexes()
 
-        self._directives = super().get_directives()
-
-        for prefix, domain in self.get_domains():
-            fmt = "{prefix}:{name}" if prefix else "{name}"
-
-            for name, directive in domain.directives.items():
-                key = fmt.format(name=name, prefix=prefix)
-                self._directives[key] = directive
-
-        return self._directives
+        return typing.cast(Dict[str, Directive], self._directives)
 
     def get_directive_options(self, name: str) -> Dict[str, Any]:
         """Return the options specification for the given directive."""
@@ -517,19 +572,10 @@ class SphinxLanguageServer(RstLanguageServer):
     def get_roles(self) -> Dict[str, Any]:
         """Return a dictionary of known roles."""
 
-        if self._roles is not None:
-            return self._roles
-
-        self._roles = super().get_roles()
+        if self._roles is None:
+            self._build_indexes()
 
-        for prefix, domain in self.get_domains():
-            fmt = "{prefix}:{name}" if prefix else "{name}"
-
-            for name, role in domain.roles.items():
-                key = fmt.format(name=name, prefix=prefix)
-                self._roles[key] = role
-
-        return self._roles
+        return typing.cast(Dict[str, Any], self._roles)
 
     def get_default_role(self) -> Tuple[Optional[str], Optional[str]]:
         """Return the project's default role"""
@@ -565,25 +611,12 @@ class SphinxLanguageServer(RstLanguageServer):
            }
         """
 
-        key = f"{domain_name}:{name}" if domain_name else name
+        key = domain_name + ":" + name if domain_name else name
 
-        if self._role_target_types is not None:
-            return self._role_target_types.get(key, [])
-
-        self._role_target_types = {}
-
-        for prefix, domain in self.get_domains():
-            fmt = "{prefix}:{name}" if prefix else "{name}"
+        if self._role_target_types is None:
+            self._build_indexes()
 
-            for name, item_type in domain.object_types.items():
-                for role in item_type.roles:
-                    role_key = fmt.format(name=role, prefix=prefix)
-                    target_types = self._role_target_types.get(role_key, list())
-                    target_types.append(fmt.format(name=name, prefix=prefix))
-
-                    self._role_target_types[role_key] = target_types
-
-        types = self._role_target_types.get(key, [])
+        types = typing.cast(Dict[str, List[str]], self._role_target_types).get(key, [])
         self.logger.debug("Role '%s' targets object types '%s'", key, types)
 
         return types
@@ -599,8 +632,8 @@ class SphinxLanguageServer(RstLanguageServer):
            The domain the role is a part of, if applicable.
         """
 
-        if not self._role_targets:
-            self._index_role_targets()
+        if self._role_targets is None:
+            self._role_targets = self._index_role_targets()
 
         targets: List[tuple] = []
         for target_type in self.get_role_target_types(name, domain):
@@ -608,18 +641,65 @@ class SphinxLanguageServer(RstLanguageServer):
 
         return targets
 
-    def _index_role_targets(self):
-        self._role_targets = {}
+    def _clear_indexes(self):
+        """Discard the cached domains, directives, roles and role targets so that they
+        are recomputed from the current application on next use."""
+
+        self._domains = None
+        self._directives = None
+        self._roles = None
+        self._role_target_types = None
+        self._role_targets = None
+
+    def _build_indexes(self):
+        """Index the directives, roles and role target types provided by the project's
+        domains in a single pass."""
+
+        # Start from the directives and roles provided by docutils.
+        self._directives = None
+        self._roles = None
+        directives = super().get_directives()
+        roles = super().get_roles()
+        role_target_types: Dict[str, List[str]] = {}
+
+        # Names are interned, the target types recorded here are used to look up
+        # entries in the role target index which is keyed by the same strings.
+        for prefix, domain in self.get_domains():
+            prefix_colon = f"{prefix}:" if prefix else ""
+
+            for name, directive in domain.directives.items():
+                directives[sys.intern(prefix_colon + name)] = directive
+
+            for name, role in domain.roles.items():
+                roles[sys.intern(prefix_colon + name)] = role
+
+            for name, item_type in domain.object_types.items():
+                target_type = sys.intern(prefix_colon + name)
+
+                for role in item_type.roles:
+                    role_key = sys.intern(prefix_colon + role)
+                    role_target_types.setdefault(role_key, []).append(target_type)
+
+        self._directives = directives
+        self._roles = roles
+        self._role_target_types = role_target_types
 
-        for prefix, domain_obj in self.get_domains():
-            fmt = "{prefix}:{name}" if prefix else "{name}"
+    def _index_role_targets(self) -> Dict[str, List[tuple]]:
+        """Index every object in the project's domains by its object type.
 
-            for obj in domain_obj.get_objects():
-                obj_key = fmt.format(name=obj[2], prefix=prefix)
-                objects = self._role_targets.get(obj_key, list())
-                objects.append(obj)
+        This has to visit every object in the project, so unlike the indexes built by
+        ``_build_indexes`` it is only done once role targets are actually needed.
+        """
+        role_targets: Dict[str, List[tuple]] = {}
 
-                self._role_targets[obj_key] = objects
+        for prefix, domain in self.get_domains():
+            prefix_colon = f"{prefix}:" if prefix else ""
+
+            for obj in domain.get_objects():
+                obj_key = sys.intern(prefix_colon + obj[2])
+                role_targets.setdefault(obj_key, []).append(obj)
+
+        return role_targets
 
     def get_intersphinx_projects(self) -> List[str]:
         """Return the list of configured intersphinx project names."""
@@ -677,7 +757,8 @@ class SphinxLanguageServer(RstLanguageServer):
 
         targets = {}
         inv = inv[project]
-        primary_domain = self.app.config.primary_domain or ""
+        primary_prefix = (self.app.config.primary_domain or "") + ":"
+        std_prefix = "std:"
 
         for target_type in self.get_role_target_types(name, domain):
 
@@ -687,13 +768,15 @@ class SphinxLanguageServer(RstLanguageServer):
 
             # Intersphinx targets are always namespaced, so we would need to be explicit
             # about the domain the type sits in.
-            if f"{primary_domain}:{target_type}" in inv:
-                targets[target_type] = inv[f"{primary_domain}:{target_type}"]
+            key = primary_prefix + target_type
+            if key in inv:
+                targets[target_type] = inv[key]
                 continue
 
             # The 'std' domain must also be considered.
-            if f"std:{target_type}" in inv:
-                targets[target_type] = inv[f"std:{target_type}"]
+            key = std_prefix + target_type
+            if key in inv:
+                targets[target_type] = inv[key]
 
         return targets
 
@@ -706,14 +789,40 @@ def find_conf_dir(root_uri: str, config: SphinxConfig) -> Optional[pathlib.Path]
     if config.conf_dir:
         return expand_conf_dir(root, config.conf_dir)
 
-    ignore_paths = [".tox", "site-packages"]
+    candidate = _scan_for_conf(root, IGNORED_DIRS)
+    if candidate is None:
+        return None
+
+    return pathlib.Path(candidate)
+
+
+def _scan_for_conf(root: str, skips: FrozenSet[str]) -> Optional[str]:
+    """Return the first directory under ``root`` that contains a ``conf.py`` file.
+
+    Rather than filtering results after the fact, any directories named in ``skips``
+    (or that are hidden) are never descended into.
+    """
+
+    stack = [root]
+
+    while stack:
+        dirname = stack.pop()
+        subdirs = []
 
-    for candidate in pathlib.Path(root).glob("**/conf.py"):
-        # Skip any files that obviously aren't part of the project
-        if any(path in str(candidate) for path in ignore_paths):
+        try:
+            with os.scandir(dirname) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in skips and not entry.name.startswith("."):
+                            subdirs.append(entry.path)
+
+                    elif entry.name == "conf.py" and entry.is_file():
+                        return dirname
+        except OSError:
             continue
 
-        return candidate.parent
+        # Preserve the order in which we found the directories.
+        stack.extend(reversed(subdirs))
 
     return None
 
@@ -735,12 +844,7 @@ def expand_conf_dir(root_dir: str, conf_dir: str) -> pathlib.Path:
        The user provided path
     """
 
-    match = PATH_VAR_PATTERN.match(conf_dir)
-    if not match or match.group(1) != "workspaceRoot":
-        return pathlib.Path(conf_dir)
-
-    conf = pathlib.Path(conf_dir).parts[1:]
-    return pathlib.Path(root_dir, *conf).resolve()
+    return _expand_path_vars(conf_dir, root_dir=root_dir) or pathlib.Path(conf_dir)
 
 
 def get_src_dir(
@@ -774,16 +878,8 @@ def get_src_dir(
     src_dir = config.src_dir
     root_dir = Uri.to_fs_path(root_uri)
 
-    match = PATH_VAR_PATTERN.match(src_dir)
-    if match and match.group(1) == "workspaceRoot":
-        src = pathlib.Path(src_dir).parts[1:]
-        return pathlib.Path(root_dir, *src).resolve()
-
-    if match and match.group(1) == "confDir":
-        src = pathlib.Path(src_dir).parts[1:]
-        return pathlib.Path(conf_dir, *src).resolve()
-
-    return pathlib.Path(src_dir)
+    src = _expand_path_vars(src_dir, root_dir=root_dir, conf_dir=str(conf_dir))
+    return src or pathlib.Path(src_dir)
 
 
 def get_build_dir(
@@ -815,21 +911,24 @@ def get_build_dir(
 
     if not config.build_dir:
         # Try to pick a sensible dir based on the project's location
-        cache = appdirs.user_cache_dir("esbonio", "swyddfa")
-        project = hashlib.md5(str(conf_dir).encode()).hexdigest()
+        cache = pathlib.Path(appdirs.user_cache_dir("esbonio", "swyddfa"))
+        project = hashlib.blake2b(
+            str(conf_dir).encode("utf-8"), digest_size=16
+        ).hexdigest()
 
-        return pathlib.Path(cache) / project
+        build_dir = cache / project
+        if not build_dir.exists():
+            _migrate_build_dir(cache, conf_dir, build_dir)
 
-    root_dir = Uri.to_fs_path(root_uri)
-    match = PATH_VAR_PATTERN.match(config.build_dir)
+        return build_dir
 
-    if match and match.group(1) == "workspaceRoot":
-        build = pathlib.Path(config.build_dir).parts[1:]
-        return pathlib.Path(root_dir, *build).resolve()
+    root_dir = Uri.to_fs_path(root_uri)
+    build = _expand_path_vars(
+        config.build_dir, root_dir=root_dir, conf_dir=str(conf_dir)
+    )
 
-    if match and match.group(1) == "confDir":
-        build = pathlib.Path(config.build_dir).parts[1:]
-        return pathlib.Path(conf_dir, *build).resolve()
+    if build is not None:
+        return build
 
     # Convert path to/from uri so that any path quirks from windows are
     # automatically handled
@@ -839,6 +938,91 @@ def get_build_dir(
     return pathlib.Path(build_dir)
 
 
+def hash_file(path: Union[str, pathlib.Path]) -> Optional[bytes]:
+    """Return a hash of the given file's contents.
+
+    Returns ``None`` if the file cannot be read.
+
+    Parameters
+    ----------
+    path:
+       The path to the file to hash.
+    """
+
+    try:
+        with open(path, "rb") as f:
+            return hashlib.blake2b(f.read(), digest_size=8).digest()
+    except OSError:
+        return None
+
+
+def _migrate_build_dir(
+    cache: pathlib.Path, conf_dir: pathlib.Path, build_dir: pathlib.Path
+) -> None:
+    """Move a build dir created by an older version of the server to its new location.
+
+    Older versions named the directory using an md5 hash of the project's ``conf_dir``,
+    moving it means any existing build outputs can be reused.
+    """
+
+    try:
+        old_dir = cache / hashlib.md5(str(conf_dir).encode()).hexdigest()
+    except ValueError:
+        # md5 is not available on some systems e.g. those in FIPS mode.
+        return
+
+    if not old_dir.is_dir():
+        return
+
+    try:
+        old_dir.rename(build_dir)
+    except OSError:
+        pass
+
+
+def _expand_path_vars(
+    path: str, root_dir: Optional[str] = None, conf_dir: Optional[str] = None
+) -> Optional[pathlib.Path]:
+    """Expand the variable (if any) at the start of the given path.
+
+    Returns ``None`` if the path does not start with a variable we know how to expand.
+
+    Parameters
+    ----------
+    path:
+       The user provided path
+    root_dir:
+       The value of ``${workspaceRoot}``, if it is available.
+    conf_dir:
+       The value of ``${confDir}``, if it is available.
+    """
+
+    # Most paths don't contain any variables, so avoid the regex if we can.
+    if not path.startswith("${"):
+        return None
+
+    return _expand_path_vars_cached(path, root_dir, conf_dir)
+
+
+@functools.lru_cache(maxsize=64)
+def _expand_path_vars_cached(
+    path: str, root_dir: Optional[str], conf_dir: Optional[str]
+) -> Optional[pathlib.Path]:
+    match = PATH_VAR_PATTERN.match(path)
+    if not match:
+        return None
+
+    variables = {"workspaceRoot": root_dir, "confDir": conf_dir}
+    base = variables.get(match.group(1), None)
+    if base is None:
+        return None
+
+    # Like Sphinx itself, only normalise the path rather than resolving it against
+    # the filesystem.
+    parts = pathlib.Path(path).parts[1:]
+    return pathlib.Path(os.path.normpath(os.path.join(base, *parts)))
+
+
 cli = setup_cli("esbonio.lsp.sphinx", "Esbonio's Sphinx language server.")
 cli.set_defaults(modules=DEFAULT_MODULES)
 cli.set_defaults(server_cls=SphinxLanguageServer)
@@ -0,0 +1,69 @@
+import asyncio
+import re
+from typing import List
+from typing import Tuple
+
+import py.test
+import pygls.uris as uri
+from pygls.lsp.types import Diagnostic
+from pygls.lsp.types import Position
+from pygls.lsp.types import Range
+
+from esbonio.lsp.rst import LanguageFeature
+from esbonio.lsp.rst import RstLanguageServer
+
+
+def test_feature_triggers_are_tuples():
+    """Ensure that triggers given as lists are stored as tuples."""
+
+    pattern = re.compile(r"\w+")
+
+    class Feature(LanguageFeature):
+        completion_triggers = [pattern]  # type: ignore
+
+    assert Feature.completion_triggers == (pattern,)
+    assert Feature.definition_triggers == ()
+
+
+@py.test.mark.parametrize("attr", ["completion_triggers", "definition_triggers"])
+def test_feature_triggers_must_be_compiled(attr):
+    """Ensure that we reject triggers that are not compiled regular expressions."""
+
+    with py.test.raises(TypeError, match=attr):
+        type("Feature", (LanguageFeature,), {attr: (r"\w+",)})
+
+
+def test_sync_diagnostics_only_publishes_changes():
+    """Ensure that only uris with changed diagnostics are sent to the client."""
+
+    server = RstLanguageServer(loop=asyncio.new_event_loop())
+    published: List[Tuple[str, List[Diagnostic]]] = []
+    server.publish_diagnostics = lambda u, diags: published.append((u, diags))  # type: ignore
+
+    def diagnostic(message):
+        return Diagnostic(
+            range=Range(
+                start=Position(line=0, character=0),
+                end=Position(line=1, character=0),
+            ),
+            message=message,
+        )
+
+    a = uri.from_fs_path("/path/to/a.rst")
+    b = uri.from_fs_path("/path/to/b.rst")
+
+    server.set_diagnostics("test", a, [diagnostic("a")])
+    server.set_diagnostics("test", b, [diagnostic("b")])
+    server.sync_diagnostics()
+    assert {u for u, _ in published} == {a, b}
+
+    # Nothing has changed, so nothing should be published.
+    published.clear()
+    server.set_diagnostics("test", a, [diagnostic("a")])
+    server.sync_diagnostics()
+    assert published == []
+
+    # Only the uri that has changed should be published.
+    server.clear_diagnostics("test", b)
+    server.sync_diagnostics()
+    assert published == [(b, [])]
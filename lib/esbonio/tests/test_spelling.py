@@ -0,0 +1,60 @@
+import asyncio
+
+import py.test
+import pygls.uris as uri
+from pygls.lsp.methods import TEXT_DOCUMENT_DID_SAVE
+from pygls.lsp.types import DidSaveTextDocumentParams
+from pygls.lsp.types import TextDocumentIdentifier
+
+from esbonio.lsp import create_language_server
+from esbonio.lsp.sphinx import DEFAULT_MODULES
+from esbonio.lsp.sphinx import SphinxLanguageServer
+from esbonio.lsp.testing import ClientServer
+
+
+@py.test.fixture(scope="function")
+async def cs():
+    """A disposable client server with the spelling feature enabled."""
+
+    server = create_language_server(
+        SphinxLanguageServer,
+        DEFAULT_MODULES + ["esbonio.lsp.spelling"],
+        loop=asyncio.new_event_loop(),
+    )
+
+    test = ClientServer(server)
+    yield test
+    # Test cleanup.
+    await test.stop()
+
+
+@py.test.mark.asyncio
+@py.test.mark.timeout(10)
+async def test_save_reports_misspellings(cs, tmp_path):
+    """Ensure that saving a document spell checks its latest contents."""
+
+    (tmp_path / "conf.py").write_text('project = "Spelling"\n')
+    index_path = tmp_path / "index.rst"
+    index_path.write_text("Spelling\n========\n\nHello world and welcome\n")
+    index_uri = uri.from_fs_path(str(index_path))
+
+    test = cs  # type: ClientServer
+    await test.start(uri.from_fs_path(str(tmp_path)))
+
+    index_path.write_text("Spelling\n========\n\nHello wrold and welcome\n")
+    test.client.lsp.notify(
+        TEXT_DOCUMENT_DID_SAVE,
+        DidSaveTextDocumentParams(text_document=TextDocumentIdentifier(uri=index_uri)),
+    )
+
+    await test.client.lsp.wait_for_notification_async("esbonio/buildComplete")
+
+    diagnostics = [
+        d for d in test.client.diagnostics[index_uri] if d.source == "spellcheck[en]"
+    ]
+    assert len(diagnostics) == 1
+    assert diagnostics[0].message == "Incorrect spelling: 'wrold'"
+
+    start, end = diagnostics[0].range.start, diagnostics[0].range.end
+    assert (start.line, start.character) == (3, 6)
+    assert (end.line, end.character) == (3, 11)
@@ -1,9 +1,11 @@
 import asyncio
+import hashlib
 import pathlib
 import tempfile
 from typing import Any
 from typing import Dict
 
+import appdirs
 import py.test
 import pygls.uris as uri
 from pygls.lsp.methods import TEXT_DOCUMENT_DID_CHANGE
@@ -30,10 +32,14 @@ from pygls.lsp.types import TextDocumentItem
 from pygls.lsp.types import VersionedTextDocumentIdentifier
 
 from esbonio.lsp import create_language_server
+from esbonio.lsp.sphinx import BUILD_DELAY
 from esbonio.lsp.sphinx import DEFAULT_MODULES
+from esbonio.lsp.sphinx import find_conf_dir
+from esbonio.lsp.sphinx import get_build_dir
 from esbonio.lsp.sphinx import InitializationOptions
 from esbonio.lsp.sphinx import SphinxConfig
 from esbonio.lsp.sphinx import SphinxLanguageServer
+from esbonio.lsp.sphinx import SphinxLogHandler
 from esbonio.lsp.testing import ClientServer
 
 
@@ -599,6 +605,188 @@ image file not readable: notfound.png""",
     index_path.unlink()
 
 
+@py.test.mark.asyncio
+@py.test.mark.timeout(10)
+async def test_save_conf_py_reload(cs, testdata):
+    """Ensure that the Sphinx application is only recreated when the saved
+    ``conf.py`` file has actually changed."""
+
+    root_path = testdata("sphinx-extensions", path_only=True)
+    conf_path = root_path / "conf.py"
+    conf_uri = uri.from_fs_path(str(conf_path))
+
+    test = cs  # type: ClientServer
+    await test.start(uri.from_fs_path(str(root_path)))
+
+    app = test.server.app
+    assert app is not None
+
+    def save():
+        test.client.lsp.notify(
+            TEXT_DOCUMENT_DID_SAVE,
+            DidSaveTextDocumentParams(
+                text_document=TextDocumentIdentifier(uri=conf_uri)
+            ),
+        )
+
+    # Saving without making any changes should keep the existing application.
+    save()
+    await test.client.lsp.wait_for_notification_async("esbonio/buildComplete")
+    assert test.server.app is app
+
+    original = conf_path.read_text()
+
+    try:
+        conf_path.write_text(original + "\n# A change\n")
+
+        save()
+        await test.client.lsp.wait_for_notification_async("esbonio/buildComplete")
+        assert test.server.app is not app
+    finally:
+        conf_path.write_text(original)
+
+
+@py.test.mark.asyncio
+@py.test.mark.timeout(10)
+@py.test.mark.parametrize("filename", ["my_conf.py", "notconf.py"])
+async def test_save_other_conf_py(cs, testdata, filename):
+    """Ensure that saving a file that merely ends with ``conf.py`` is treated as a
+    regular file, rather than a change to the project's configuration."""
+
+    root_path = testdata("sphinx-extensions", path_only=True)
+    file_uri = uri.from_fs_path(str(root_path / filename))
+
+    test = cs  # type: ClientServer
+    await test.start(uri.from_fs_path(str(root_path)))
+
+    app = test.server.app
+    assert app is not None
+
+    diagnostic = Diagnostic(
+        source="sphinx",
+        message="A problem",
+        range=Range(
+            start=Position(line=0, character=0),
+            end=Position(line=1, character=0),
+        ),
+    )
+    test.server.set_diagnostics("sphinx", file_uri, [diagnostic])
+
+    test.client.lsp.notify(
+        TEXT_DOCUMENT_DID_SAVE,
+        DidSaveTextDocumentParams(text_document=TextDocumentIdentifier(uri=file_uri)),
+    )
+
+    await test.client.lsp.wait_for_notification_async("esbonio/buildComplete")
+    assert test.server.app is app
+    assert test.server._diagnostics[("sphinx", file_uri)] == []
+
+
+@py.test.mark.asyncio
+@py.test.mark.timeout(10)
+async def test_save_debounces_builds(cs, testdata):
+    """Ensure that a burst of saves only results in a single build."""
+
+    root_path = testdata("sphinx-extensions", path_only=True)
+    index_uri = uri.from_fs_path(str(root_path / "index.rst"))
+
+    test = cs  # type: ClientServer
+    await test.start(uri.from_fs_path(str(root_path)))
+
+    builds = []
+    build = test.server.build
+
+    def counting_build():
+        builds.append(1)
+        build()
+
+    test.server.build = counting_build  # type: ignore
+
+    for _ in range(3):
+        test.client.lsp.notify(
+            TEXT_DOCUMENT_DID_SAVE,
+            DidSaveTextDocumentParams(
+                text_document=TextDocumentIdentifier(uri=index_uri)
+            ),
+        )
+
+    await test.client.lsp.wait_for_notification_async("esbonio/buildComplete")
+
+    # Give any (unexpected) additional builds the chance to happen.
+    await asyncio.sleep(2 * BUILD_DELAY)
+    assert len(builds) == 1
+
+
+@py.test.mark.parametrize(
+    "files,expected",
+    [
+        (["conf.py"], "."),
+        (["docs/conf.py"], "docs"),
+        ([".tox/py39/conf.py", "docs/conf.py"], "docs"),
+        (["env/lib/site-packages/pkg/conf.py", "docs/conf.py"], "docs"),
+        (["node_modules/pkg/conf.py"], None),
+        (["venv/conf.py", ".venv/conf.py"], None),
+    ],
+)
+def test_find_conf_dir(tmp_path, files, expected):
+    """Ensure that we can find the project's conf.py, skipping any directories that
+    obviously aren't part of the project."""
+
+    for file in files:
+        path = tmp_path / file
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+
+    actual = find_conf_dir(uri.from_fs_path(str(tmp_path)), SphinxConfig())
+
+    if expected is None:
+        assert actual is None
+    else:
+        assert actual == tmp_path / expected
+
+
+@py.test.mark.parametrize(
+    "location,expected",
+    [
+        ("/path/to/file.rst", ("/path/to/file.rst", None)),
+        ("/path/to/file.rst:", ("/path/to/file.rst", None)),
+        ("/path/to/file.rst:12", ("/path/to/file.rst", 12)),
+        ("/path/to/file.py:docstring of a.b.c", ("/path/to/file.py", None)),
+        ("/path/to/file.py:docstring of a.b.c:8", ("/path/to/file.py", None)),
+        ("/path/to/file.rst:<translated>", ("/path/to/file.rst", None)),
+        ("/path/to/file.rst:12:<translated>:1", ("/path/to/file.rst", 12)),
+        ("C:\\path\\to\\file.rst", ("C:\\path\\to\\file.rst", None)),
+        ("C:\\path\\to\\file.rst:12", ("C:\\path\\to\\file.rst", 12)),
+    ],
+)
+def test_get_location(location, expected):
+    """Ensure that we can correctly parse the location of a Sphinx warning."""
+
+    handler = SphinxLogHandler(None, None)
+    path, lineno = expected
+
+    assert handler.get_location(location) == (uri.from_fs_path(path), lineno)
+
+
+def test_get_build_dir_migrates_old_dir(tmp_path, monkeypatch):
+    """Ensure that a build dir created by an older version of the server is reused."""
+
+    cache = tmp_path / "cache"
+    conf_dir = tmp_path / "docs"
+    monkeypatch.setattr(appdirs, "user_cache_dir", lambda *args: str(cache))
+
+    old_dir = cache / hashlib.md5(str(conf_dir).encode()).hexdigest()
+    (old_dir / "doctrees").mkdir(parents=True)
+
+    root_uri = uri.from_fs_path(str(tmp_path))
+    build_dir = get_build_dir(root_uri, conf_dir, SphinxConfig())
+
+    assert build_dir.parent == cache
+    assert build_dir != old_dir
+    assert not old_dir.exists()
+    assert (build_dir / "doctrees").is_dir()
+
+
 def resolve_path(value: str, root_path: str) -> str:
 
     if value.startswith("$"):